@@ -0,0 +1,16 @@
+# gunicorn settings used by Procfile / railway.json: gunicorn -c gunicorn_conf.py wsgi:app
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Threaded workers suit the blocking sqlite3 calls. Each worker keeps one read
+# connection per thread (see ConnectionPool in main.py), so both read WEB_THREADS.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+threads = int(os.environ.get('WEB_THREADS', 8))
+
+# Import the app once so database setup runs before the workers fork
+preload_app = True
+
+# Reuse client connections between requests behind Railway's proxy
+keepalive = 5
@@ -1,27 +1,447 @@
+import atexit
+import hmac
+import logging
 import os
+import queue
 import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, send_from_directory, jsonify, request
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from flask import Flask, abort, g, send_from_directory, jsonify, request, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from werkzeug.exceptions import NotFound
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Match the stdlib provider's tolerance for int/date dict keys
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson so every jsonify() call skips the stdlib encoder"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # orjson already produces bytes, so hand them to the response without a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=_ORJSON_OPTIONS),
+            mimetype='application/json'
+        )
+
+# Log records are handed to a queue and written to stdout by a background
+# thread, so request handlers never block on the stream
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_stream)
+
+# An unknown LOG_LEVEL falls back to INFO (with a warning below) rather than
+# failing the boot
+_LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+_LOG_LEVEL_VALID = isinstance(logging.getLevelName(_LOG_LEVEL), int)
+
+logger = logging.getLogger(__name__)
+logger.setLevel(_LOG_LEVEL if _LOG_LEVEL_VALID else logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# gunicorn --preload forks workers after import and threads do not survive a fork
+os.register_at_fork(after_in_child=_log_listener.start)
+
+if not _LOG_LEVEL_VALID:
+    logger.warning("⚠️ Unknown LOG_LEVEL %r, using INFO", _LOG_LEVEL)
 
 app = Flask(__name__, static_folder='static')
 app.config['SECRET_KEY'] = 'mces-scheduler-2024'
+app.json = OrjsonProvider(app)
+
+# Let browsers reuse static files for an hour instead of re-fetching them
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+
+# Every JSON body this API accepts is a few hundred bytes
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+
+# Enable CORS for all routes; browsers may reuse a preflight answer for a day
+CORS(app, origins="*", max_age=86400)
+
+# Compress responses; the admin registration listing repeats the same keys on every row
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+# Registered by compress_response below, which picks what to compress
+app.config['COMPRESS_REGISTER'] = False
+compress = Compress(app)
 
-# Enable CORS for all routes
-CORS(app, origins="*")
+@app.after_request
+def compress_response(response):
+    """Compress the response, then answer revalidations against the compressed ETag"""
+    # Compressing a stream buffers all of it first. Static files are streamed
+    # but have a known length, so only generator bodies are left alone.
+    if response.is_streamed and response.content_length is None:
+        return response
+    
+    # Static files are checked against If-None-Match before compression, and
+    # Flask-Compress then renames the ETag (e.g. '"abc:br"'), so a client
+    # revalidating what it was sent would otherwise always get the full body
+    response = compress.after_request(response)
+    if response.status_code == 200 and 'Content-Encoding' in response.headers and 'ETag' in response.headers:
+        response.make_conditional(request.environ)
+    return response
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), 'database', 'app.db')
 
+# SQL used on request paths. Passing the same string object on every call lets
+# sqlite3's per-connection statement cache skip re-preparing the statement.
+# Times are trimmed to HH:MM here because rows written through the ORM models
+# store them as HH:MM:SS.ffffff.
+_SQL_GET_QUARTERS = '''
+    SELECT q.id, q.year, q.quarter_number, q.meeting_date, q.is_active,
+           COUNT(ls.id) as total_slots,
+           SUM(CASE WHEN ls.is_available = 1 THEN 1 ELSE 0 END) as available_slots
+    FROM quarters q
+    LEFT JOIN lecture_slots ls ON q.id = ls.quarter_id
+    WHERE q.is_active = 1
+    GROUP BY q.id, q.year, q.quarter_number, q.meeting_date, q.is_active
+    ORDER BY q.year DESC, q.quarter_number ASC
+'''
+
+_SQL_QUARTER_SLOTS = '''
+    SELECT 
+        ls.id, 
+        ls.is_available, 
+        substr(ts.start_time, 1, 5) AS start_time,
+        substr(ts.end_time, 1, 5) AS end_time,
+        substr(ts.start_time, 1, 5) || ' - ' || substr(ts.end_time, 1, 5) AS time_display,
+        ts.slot_name,
+        sr.speaker_name,
+        sr.topic_title
+    FROM lecture_slots ls
+    JOIN time_slots ts ON ls.time_slot_id = ts.id
+    LEFT JOIN speaker_registrations sr
+        ON ls.id = sr.lecture_slot_id AND sr.status = 'confirmed'
+    WHERE ls.quarter_id = ?
+    ORDER BY ts.start_time
+'''
+
+# Claim an open slot and return what the notification needs in one statement.
+# SQLite doesn't let RETURNING reference UPDATE ... FROM tables, so the quarter
+# and time details come from primary-key subqueries instead.
+_SQL_CLAIM_SLOT = '''
+    UPDATE lecture_slots SET is_available = 0 WHERE id = ? AND is_available = 1
+    RETURNING
+        (SELECT year FROM quarters WHERE id = quarter_id) AS year,
+        (SELECT quarter_number FROM quarters WHERE id = quarter_id) AS quarter_number,
+        (SELECT meeting_date FROM quarters WHERE id = quarter_id) AS meeting_date,
+        (SELECT substr(start_time, 1, 5) FROM time_slots WHERE id = time_slot_id) AS start_time,
+        (SELECT substr(end_time, 1, 5) FROM time_slots WHERE id = time_slot_id) AS end_time
+'''
+
+_SQL_INSERT_REGISTRATION = '''
+    INSERT INTO speaker_registrations 
+    (lecture_slot_id, speaker_name, speaker_email, speaker_phone, specialty, topic_title, topic_description, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_REGISTRATIONS_SELECT = '''
+    SELECT 
+        sr.id,
+        sr.speaker_name,
+        sr.speaker_email,
+        sr.speaker_phone,
+        sr.specialty,
+        sr.topic_title,
+        sr.topic_description,
+        sr.registered_at,
+        sr.status,
+        q.year,
+        q.quarter_number,
+        q.meeting_date,
+        substr(ts.start_time, 1, 5) || ' - ' || substr(ts.end_time, 1, 5) AS time_display,
+        ts.slot_name
+    FROM speaker_registrations sr
+    JOIN lecture_slots ls ON sr.lecture_slot_id = ls.id
+    JOIN quarters q ON ls.quarter_id = q.id
+    JOIN time_slots ts ON ls.time_slot_id = ts.id
+'''
+
+_SQL_ALL_REGISTRATIONS = _SQL_REGISTRATIONS_SELECT + '''
+    ORDER BY q.year DESC, q.quarter_number ASC, ts.start_time ASC
+'''
+
+# Keyset page for ?limit=N[&after_id=M]: walks the primary key so each page
+# costs O(limit) no matter how many registrations precede it
+_SQL_REGISTRATIONS_PAGE = _SQL_REGISTRATIONS_SELECT + '''
+    WHERE sr.id > ?
+    ORDER BY sr.id
+    LIMIT ?
+'''
+
+_REGISTRATIONS_PAGE_MAX = 500
+
+_SQL_ACADEMIC_YEARS = '''
+    SELECT 
+        q.year,
+        COUNT(q.id) as quarter_count,
+        COUNT(sr.id) as registration_count,
+        MIN(q.meeting_date) as first_meeting,
+        MAX(q.meeting_date) as last_meeting
+    FROM quarters q
+    LEFT JOIN lecture_slots ls ON q.id = ls.quarter_id
+    LEFT JOIN speaker_registrations sr ON ls.id = sr.lecture_slot_id
+    GROUP BY q.year
+    ORDER BY q.year DESC
+'''
+
+_SQL_ADMIN_BY_USERNAME = 'SELECT id, username, password_hash FROM admin_users WHERE username = ?'
+
+_SQL_COUNT_YEAR_QUARTERS = 'SELECT COUNT(*) FROM quarters WHERE year = ?'
+
+# Removing a year goes registrations -> lecture slots -> quarters so no row is
+# left pointing at a deleted parent
+_SQL_COUNT_YEAR_REGISTRATIONS = '''
+    SELECT COUNT(*) FROM speaker_registrations
+    WHERE lecture_slot_id IN (
+        SELECT id FROM lecture_slots
+        WHERE quarter_id IN (SELECT id FROM quarters WHERE year = ?)
+    )
+'''
+
+_SQL_DELETE_YEAR_REGISTRATIONS = '''
+    DELETE FROM speaker_registrations
+    WHERE lecture_slot_id IN (
+        SELECT id FROM lecture_slots
+        WHERE quarter_id IN (SELECT id FROM quarters WHERE year = ?)
+    )
+'''
+
+_SQL_DELETE_YEAR_LECTURE_SLOTS = '''
+    DELETE FROM lecture_slots
+    WHERE quarter_id IN (SELECT id FROM quarters WHERE year = ?)
+'''
+
+_SQL_DELETE_YEAR_QUARTERS = 'DELETE FROM quarters WHERE year = ?'
+
+_SQL_INSERT_QUARTER = '''
+    INSERT INTO quarters (year, quarter_number, meeting_date, is_active)
+    VALUES (?, ?, ?, 1)
+'''
+
+_SQL_YEAR_QUARTERS = 'SELECT id, quarter_number, meeting_date FROM quarters WHERE year = ? ORDER BY quarter_number'
+
+_SQL_COUNT_TIME_SLOTS = 'SELECT COUNT(*) FROM time_slots'
+
+# The default 2026 schedule: February, May, August, November
+_QUARTERS_2026 = (
+    (2026, 1, '2026-02-15'),
+    (2026, 2, '2026-05-15'),
+    (2026, 3, '2026-08-15'),
+    (2026, 4, '2026-11-15')
+)
+
+# Give every quarter of a year one open lecture slot per time slot. The
+# NOT EXISTS guard makes this safe to re-run over partially seeded years.
+_SQL_SEED_LECTURE_SLOTS = '''
+    INSERT INTO lecture_slots (quarter_id, time_slot_id, is_available)
+    SELECT q.id, ts.id, 1
+    FROM quarters q CROSS JOIN time_slots ts
+    WHERE q.year = ? AND NOT EXISTS (
+        SELECT 1 FROM lecture_slots ls
+        WHERE ls.quarter_id = q.id AND ls.time_slot_id = ts.id
+    )
+'''
+
+# Indexes behind the quarter/slot/registration joins. These are the only
+# declarations of them: create_all never adds indexes to existing tables, so
+# the models leave them to this startup step. lecture_slots needs no
+# (quarter_id, time_slot_id) index of its own: its unique constraint already
+# provides one. Nothing here filters registrations by email, so that index
+# stays with the ORM routes that do.
+_SQL_CREATE_INDEXES = (
+    'DROP INDEX IF EXISTS idx_lecture_slots_quarter',
+    'DROP INDEX IF EXISTS idx_speaker_registrations_email_status',
+    'CREATE INDEX IF NOT EXISTS idx_lecture_slots_time_slot ON lecture_slots (time_slot_id)',
+    'CREATE INDEX IF NOT EXISTS idx_speaker_registrations_slot ON speaker_registrations (lecture_slot_id)',
+    'CREATE INDEX IF NOT EXISTS idx_quarters_active_year ON quarters (is_active, year DESC, quarter_number)'
+)
+
+# Unique indexes guaranteeing one meeting per quarter and one confirmed speaker
+# per slot, each paired with a query for rows that already break the rule.
+# Older databases may hold such duplicates, and creating the index would fail.
+_SQL_CREATE_UNIQUE_INDEXES = (
+    (
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_quarters_year_number ON quarters (year, quarter_number)',
+        'SELECT 1 FROM quarters GROUP BY year, quarter_number HAVING COUNT(*) > 1 LIMIT 1'
+    ),
+    (
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_speaker_registrations_confirmed_slot "
+        "ON speaker_registrations (lecture_slot_id) WHERE status = 'confirmed'",
+        "SELECT 1 FROM speaker_registrations WHERE status = 'confirmed' "
+        "GROUP BY lecture_slot_id HAVING COUNT(*) > 1 LIMIT 1"
+    )
+)
+
+# MCES meets in February, May, August and November, indexed by quarter number
+_QUARTER_MONTHS = (None, 'February', 'May', 'August', 'November')
+
+# Only a handful of (year, quarter) pairs exist, so every listing row after the
+# first hits the cache instead of formatting the string again
+@lru_cache(maxsize=64)
+def format_quarter_name(year, quarter_number):
+    """Build the display name for a quarter, e.g. 'February 2026 - MCES Education'"""
+    if quarter_number in (1, 2, 3, 4):
+        return f"{_QUARTER_MONTHS[quarter_number]} {year} - MCES Education"
+    return f"Q{quarter_number} {year} - MCES Education"
+
+# The shipped admin row is scrypt with Werkzeug's default cost. Seeding,
+# re-hashing and the unknown-username dummy all use the same method, so every
+# login attempt does the same amount of hash work.
+_PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
+def hash_password(password):
+    """Hash a password with the method every stored admin hash converges on"""
+    return generate_password_hash(password, method=_PASSWORD_HASH_METHOD)
+
+def get_db_connection(**kwargs):
+    """Open a database connection with room to cache every prepared statement above"""
+    return sqlite3.connect(DB_PATH, cached_statements=256, **kwargs)
+
+# Per-connection tuning: NORMAL sync is safe under WAL (set once at startup,
+# it persists in the database file), and the larger page cache/mmap keep hot
+# pages out of the syscall path
+_SQL_CONNECTION_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+'''
+
+class DatabaseBusy(Exception):
+    """Raised when no pooled connection frees up within the wait"""
+
+class ConnectionPool:
+    """Fixed-size pool of tuned SQLite connections shared by a worker's threads"""
+    
+    def __init__(self, size, read_only=False):
+        self.size = size
+        self.read_only = read_only
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+    
+    def _connect(self):
+        # Pooled connections move between request threads, but only one
+        # request holds a connection at a time
+        conn = get_db_connection(check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_SQL_CONNECTION_PRAGMAS)
+        if self.read_only:
+            conn.execute('PRAGMA query_only=1')
+        return conn
+    
+    def acquire(self, timeout=5):
+        """Take an idle connection, opening a new one while under the size limit"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                opened = True
+            else:
+                opened = False
+        if opened:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                raise
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise DatabaseBusy() from None
+    
+    def release(self, conn):
+        """Hand a connection back, discarding anything its request left uncommitted"""
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+    
+    def reset(self):
+        """Forget every connection; used in forked children, which must not share them"""
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+
+# Readers run concurrently under WAL, one per gunicorn thread (WEB_THREADS).
+# SQLite only ever has one writer, so writes queue here instead of spinning on
+# SQLITE_BUSY.
+_read_pool = ConnectionPool(size=int(os.environ.get('WEB_THREADS', 8)), read_only=True)
+_write_pool = ConnectionPool(size=1)
+
+def _reset_pools():
+    """Drop connections inherited from the parent process after a fork"""
+    _read_pool.reset()
+    _write_pool.reset()
+
+os.register_at_fork(after_in_child=_reset_pools)
+
+def get_db(write=False):
+    """Return the request's pooled connection, taking it from the pool on first use"""
+    attr, pool = ('_write_db', _write_pool) if write else ('_read_db', _read_pool)
+    db = g.get(attr)
+    if db is None:
+        db = pool.acquire()
+        setattr(g, attr, db)
+    return db
+
+@app.teardown_appcontext
+def release_db(exception):
+    """Return the request's connections to their pools"""
+    for attr, pool in (('_read_db', _read_pool), ('_write_db', _write_pool)):
+        db = g.pop(attr, None)
+        if db is not None:
+            pool.release(db)
+
+@app.errorhandler(DatabaseBusy)
+def database_busy(error):
+    """Tell clients to retry shortly instead of reporting a server error"""
+    return jsonify({
+        'message': 'The server is busy, please try again shortly',
+        'error_type': 'ServiceUnavailable'
+    }), 503, {'Retry-After': '1'}
+
 def ensure_database_and_data():
     """Ensure database exists with proper structure and 2026 MCES quarters"""
     try:
         # Create database directory if it doesn't exist
         os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
+        # WAL lets readers run alongside the single writer. The mode is stored in
+        # the database file, so request connections don't need to set it again;
+        # it also can't be changed inside a transaction.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
+        # Run the whole setup, schema included, as one transaction with one commit
+        cursor.execute('BEGIN')
+        
         # Create quarters table if it doesn't exist
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS quarters (
@@ -52,6 +472,7 @@ def ensure_database_and_data():
                 time_slot_id INTEGER NOT NULL,
                 is_available BOOLEAN DEFAULT 1,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (quarter_id, time_slot_id),
                 FOREIGN KEY (quarter_id) REFERENCES quarters (id),
                 FOREIGN KEY (time_slot_id) REFERENCES time_slots (id)
             )
@@ -85,6 +506,19 @@ def ensure_database_and_data():
             )
         ''')
         
+        # Index the join columns used by the quarter, slot and admin queries
+        for statement in _SQL_CREATE_INDEXES:
+            cursor.execute(statement)
+        
+        # Leave a unique index out rather than fail the boot over existing
+        # duplicates; the request handlers still check before writing
+        for statement, find_duplicates in _SQL_CREATE_UNIQUE_INDEXES:
+            cursor.execute(find_duplicates)
+            if cursor.fetchone():
+                logger.warning("⚠️ Skipped index, existing rows hold duplicates: %s", statement)
+            else:
+                cursor.execute(statement)
+        
         # Ensure we have the standard time slots with clean formatting
         cursor.execute('SELECT COUNT(*) FROM time_slots')
         slot_count = cursor.fetchone()[0]
@@ -102,7 +536,7 @@ def ensure_database_and_data():
                 VALUES (?, ?, ?)
             ''', time_slots)
             
-            print("✅ Time slots created")
+            logger.info("✅ Time slots created")
         
         # Auto-create 2026 quarters if they don't exist
         cursor.execute('SELECT COUNT(*) FROM quarters WHERE year = 2026')
@@ -110,34 +544,12 @@ def ensure_database_and_data():
         
         if not quarters_exist:
             # Create 2026 quarters automatically
-            quarters_data = [
-                (2026, 1, '2026-02-15'),  # February
-                (2026, 2, '2026-05-15'),  # May
-                (2026, 3, '2026-08-15'),  # August
-                (2026, 4, '2026-11-15')   # November
-            ]
-            
-            for year, quarter_num, meeting_date in quarters_data:
-                # Insert quarter
-                cursor.execute('''
-                    INSERT INTO quarters (year, quarter_number, meeting_date, is_active)
-                    VALUES (?, ?, ?, 1)
-                ''', (year, quarter_num, meeting_date))
-                
-                quarter_id = cursor.lastrowid
-                
-                # Get time slots
-                cursor.execute('SELECT id FROM time_slots ORDER BY start_time')
-                time_slots = cursor.fetchall()
-                
-                # Create lecture slots for this quarter
-                for time_slot in time_slots:
-                    cursor.execute('''
-                        INSERT INTO lecture_slots (quarter_id, time_slot_id, is_available)
-                        VALUES (?, ?, 1)
-                    ''', (quarter_id, time_slot[0]))
+            cursor.executemany(_SQL_INSERT_QUARTER, _QUARTERS_2026)
             
-            print("✅ 2026 MCES quarters auto-created")
+            logger.info("✅ 2026 MCES quarters auto-created")
+        
+        # Create any missing 2026 lecture slots in one statement
+        cursor.execute(_SQL_SEED_LECTURE_SLOTS, (2026,))
         
         # Create admin user if it doesn't exist
         cursor.execute('SELECT COUNT(*) FROM admin_users WHERE username = ?', ('admin',))
@@ -147,144 +559,151 @@ def ensure_database_and_data():
             cursor.execute('''
                 INSERT INTO admin_users (username, password_hash, email)
                 VALUES (?, ?, ?)
-            ''', ('admin', 'admin123', 'admin@mces.edu'))
-            print("✅ Admin user created")
+            ''', ('admin', hash_password('admin123'), 'admin@mces.edu'))
+            logger.info("✅ Admin user created")
         
         conn.commit()
         conn.close()
         
-        print("✅ Database initialized successfully")
+        logger.info("✅ Database initialized successfully")
         return True
         
-    except Exception as e:
-        print(f"❌ Database initialization error: {e}")
-        return False
+    except Exception:
+        # Fail the boot so the process manager restarts us instead of serving 500s
+        logger.exception("❌ Database initialization error")
+        raise
 
 # Initialize database on startup
 ensure_database_and_data()
 
+# The quarters listing changes a few times a year, so each worker keeps it for
+# up to QUARTERS_CACHE_TTL seconds. Writes clear the handling worker's copy;
+# other workers may show slot counts that lag by up to the TTL. Per-slot
+# availability (/api/quarters/<id>/slots) is always read live, and booking is
+# decided by the guarded claim, never by this listing.
+QUARTERS_CACHE_TTL = 30
+_quarters_cache = {}
+
+def clear_quarters_cache():
+    """Drop this worker's cached quarters listing after the schedule changes"""
+    _quarters_cache.clear()
+
 def get_quarters_data():
     """Common function to get quarters data with MCES branding"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT q.id, q.year, q.quarter_number, q.meeting_date, q.is_active,
-                   COUNT(ls.id) as total_slots,
-                   SUM(CASE WHEN ls.is_available = 1 THEN 1 ELSE 0 END) as available_slots
-            FROM quarters q
-            LEFT JOIN lecture_slots ls ON q.id = ls.quarter_id
-            WHERE q.is_active = 1
-            GROUP BY q.id, q.year, q.quarter_number, q.meeting_date, q.is_active
-            ORDER BY q.year DESC, q.quarter_number ASC
-        ''')
+        cached = _quarters_cache.get('quarters')
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
         
-        quarters = cursor.fetchall()
+        conn = get_db()
+        cursor = conn.cursor()
         
-        # Map quarter numbers to months for MCES schedule
-        quarter_months = {
-            1: 'February',
-            2: 'May', 
-            3: 'August',
-            4: 'November'
-        }
+        cursor.execute(_SQL_GET_QUARTERS)
         
         quarter_list = []
-        for q in quarters:
-            month_name = quarter_months.get(q[2], f'Q{q[2]}')
-            quarter_name = f"{month_name} {q[1]} - MCES Education"
-            
+        for q in cursor:
             quarter_list.append({
-                'id': q[0],
-                'year': q[1],
-                'quarter_number': q[2],
-                'meeting_date': q[3],
-                'is_active': bool(q[4]),
-                'name': quarter_name,
-                'total_slots': q[5] or 0,
-                'available_slots': q[6] or 0
+                'id': q['id'],
+                'year': q['year'],
+                'quarter_number': q['quarter_number'],
+                'meeting_date': q['meeting_date'],
+                'is_active': bool(q['is_active']),
+                'name': format_quarter_name(q['year'], q['quarter_number']),
+                'total_slots': q['total_slots'] or 0,
+                'available_slots': q['available_slots'] or 0
             })
         
-        conn.close()
+        _quarters_cache['quarters'] = (quarter_list, time.monotonic() + QUARTERS_CACHE_TTL)
         return quarter_list
         
-    except Exception as e:
-        print(f"Error getting quarters: {e}")
+    except DatabaseBusy:
+        raise
+    except Exception:
+        logger.exception("❌ Error getting quarters")
         return []
 
+def conditional_jsonify(data):
+    """Return data as JSON tagged with a weak ETag, or a 304 if the client already has it"""
+    # The tag is derived from the body, so every worker agrees on it without shared state
+    response = jsonify(data)
+    response.add_etag(weak=True)
+    etag, _ = response.get_etag()
+    
+    # Flask-Compress appends the content encoding to the tag it sends (e.g. "...:br")
+    if any(request.if_none_match.contains_weak(etag + suffix) for suffix in ('', ':br', ':gzip')):
+        return app.response_class(status=304, headers={'ETag': response.headers['ETag']})
+    return response
+
 # API ENDPOINTS
 
+@app.before_request
+def reject_oversized_bodies():
+    """Refuse oversized uploads before a handler reads them"""
+    # Werkzeug only enforces MAX_CONTENT_LENGTH while the body is read, inside
+    # handlers whose catch-all except would turn the 413 into a 500
+    if request.content_length and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        abort(413)
+    
+    # A chunked body carries no length and Werkzeug silently cuts it off at the
+    # limit, so read it here (handlers get the cached copy) and refuse it whole
+    if request.content_length is None and 'chunked' in request.headers.get('Transfer-Encoding', '').lower():
+        if len(request.get_data(cache=True)) >= app.config['MAX_CONTENT_LENGTH']:
+            abort(413)
+
+@app.errorhandler(413)
+def request_too_large(error):
+    """Answer oversized bodies in the API's JSON error shape"""
+    return jsonify({
+        'message': 'Request body is too large',
+        'error_type': 'RequestEntityTooLarge'
+    }), 413
+
 @app.route('/api/quarters', methods=['GET'])
 def get_all_quarters():
     """Get all active quarters"""
     quarters = get_quarters_data()
-    return jsonify(quarters), 200
+    return conditional_jsonify(quarters)
 
 @app.route('/api/quarters/active', methods=['GET'])
 def get_active_quarters():
     """Get active quarters"""
     quarters = get_quarters_data()
-    return jsonify(quarters), 200
+    return conditional_jsonify(quarters)
 
 @app.route('/api/quarters/create-2026', methods=['GET'])
 def create_2026_quarters():
     """Force create 2026 quarters"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db(write=True)
         cursor = conn.cursor()
         
+        # Rebuild the year in one write transaction
+        cursor.execute('BEGIN IMMEDIATE')
+        
         # Delete existing 2026 quarters
-        cursor.execute('DELETE FROM speaker_registrations WHERE lecture_slot_id IN (SELECT id FROM lecture_slots WHERE quarter_id IN (SELECT id FROM quarters WHERE year = 2026))')
-        cursor.execute('DELETE FROM lecture_slots WHERE quarter_id IN (SELECT id FROM quarters WHERE year = 2026)')
-        cursor.execute('DELETE FROM quarters WHERE year = 2026')
+        cursor.execute(_SQL_DELETE_YEAR_REGISTRATIONS, (2026,))
+        cursor.execute(_SQL_DELETE_YEAR_LECTURE_SLOTS, (2026,))
+        cursor.execute(_SQL_DELETE_YEAR_QUARTERS, (2026,))
         
         # Create 2026 quarters
-        quarters_data = [
-            (2026, 1, '2026-02-15'),  # February
-            (2026, 2, '2026-05-15'),  # May
-            (2026, 3, '2026-08-15'),  # August
-            (2026, 4, '2026-11-15')   # November
-        ]
+        cursor.executemany(_SQL_INSERT_QUARTER, _QUARTERS_2026)
         
-        created_quarters = []
+        # Create lecture slots for every new quarter in one statement
+        cursor.execute(_SQL_SEED_LECTURE_SLOTS, (2026,))
         
-        for year, quarter_num, meeting_date in quarters_data:
-            # Insert quarter
-            cursor.execute('''
-                INSERT INTO quarters (year, quarter_number, meeting_date, is_active)
-                VALUES (?, ?, ?, 1)
-            ''', (year, quarter_num, meeting_date))
-            
-            quarter_id = cursor.lastrowid
-            
-            # Get time slots
-            cursor.execute('SELECT id FROM time_slots ORDER BY start_time')
-            time_slots = cursor.fetchall()
-            
-            slots_created = 0
-            # Create lecture slots for this quarter
-            for time_slot in time_slots:
-                cursor.execute('''
-                    INSERT INTO lecture_slots (quarter_id, time_slot_id, is_available)
-                    VALUES (?, ?, 1)
-                ''', (quarter_id, time_slot[0]))
-                slots_created += 1
-            
-            # Map quarter number to month name
-            quarter_months = {1: 'February', 2: 'May', 3: 'August', 4: 'November'}
-            month_name = quarter_months.get(quarter_num, f'Q{quarter_num}')
-            quarter_name = f"{month_name} {year} - MCES Education"
-            
-            created_quarters.append({
-                'id': quarter_id,
-                'name': quarter_name,
-                'meeting_date': meeting_date,
-                'slots_created': slots_created
-            })
+        cursor.execute(_SQL_COUNT_TIME_SLOTS)
+        slots_per_quarter = cursor.fetchone()[0]
+        
+        cursor.execute(_SQL_YEAR_QUARTERS, (2026,))
+        created_quarters = [{
+            'id': quarter['id'],
+            'name': format_quarter_name(2026, quarter['quarter_number']),
+            'meeting_date': quarter['meeting_date'],
+            'slots_created': slots_per_quarter
+        } for quarter in cursor]
         
         conn.commit()
-        conn.close()
+        clear_quarters_cache()
         
         return jsonify({
             'message': '🎉 SUCCESS! 2026 MCES quarters created!',
@@ -293,6 +712,8 @@ def create_2026_quarters():
             'schedule': 'February, May, August, November 2026'
         }), 200
         
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'message': f'Error creating 2026 quarters: {str(e)}',
@@ -303,7 +724,7 @@ def create_2026_quarters():
 def create_academic_year():
     """Create a new academic year with custom dates"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         year = data.get('year')
         quarters_data = data.get('quarters')  # Array of {quarter_number, meeting_date}
         
@@ -320,11 +741,27 @@ def create_academic_year():
                 'error_type': 'ValidationError'
             }), 400
         
-        conn = sqlite3.connect(DB_PATH)
+        # Only complete quarters are created, each quarter number once
+        quarter_rows = [
+            (year, quarter_data.get('quarter_number'), quarter_data.get('meeting_date'))
+            for quarter_data in quarters_data
+            if quarter_data.get('quarter_number') and quarter_data.get('meeting_date')
+        ]
+        if len({row[1] for row in quarter_rows}) != len(quarter_rows):
+            return jsonify({
+                'message': 'Each quarter number can only appear once',
+                'error_type': 'ValidationError'
+            }), 400
+        
+        conn = get_db(write=True)
         cursor = conn.cursor()
         
+        # Take the write lock before the existence check so two concurrent
+        # requests can't both create the same year
+        cursor.execute('BEGIN IMMEDIATE')
+        
         # Check if year already exists
-        cursor.execute('SELECT COUNT(*) FROM quarters WHERE year = ?', (year,))
+        cursor.execute(_SQL_COUNT_YEAR_QUARTERS, (year,))
         existing_count = cursor.fetchone()[0]
         
         if existing_count > 0:
@@ -333,53 +770,28 @@ def create_academic_year():
                 'error_type': 'ConflictError'
             }), 409
         
-        created_quarters = []
+        # Insert every complete quarter in one batch
+        cursor.executemany(_SQL_INSERT_QUARTER, quarter_rows)
         
-        for quarter_data in quarters_data:
-            quarter_num = quarter_data.get('quarter_number')
-            meeting_date = quarter_data.get('meeting_date')
-            
-            if not quarter_num or not meeting_date:
-                continue
-            
-            # Insert quarter
-            cursor.execute('''
-                INSERT INTO quarters (year, quarter_number, meeting_date, is_active)
-                VALUES (?, ?, ?, 1)
-            ''', (year, quarter_num, meeting_date))
-            
-            quarter_id = cursor.lastrowid
-            
-            # Get time slots
-            cursor.execute('SELECT id FROM time_slots ORDER BY start_time')
-            time_slots = cursor.fetchall()
-            
-            slots_created = 0
-            # Create lecture slots for this quarter
-            for time_slot in time_slots:
-                cursor.execute('''
-                    INSERT INTO lecture_slots (quarter_id, time_slot_id, is_available)
-                    VALUES (?, ?, 1)
-                ''', (quarter_id, time_slot[0]))
-                slots_created += 1
-            
-            # Map quarter number to month name
-            quarter_months = {1: 'February', 2: 'May', 3: 'August', 4: 'November'}
-            month_name = quarter_months.get(quarter_num, f'Q{quarter_num}')
-            quarter_name = f"{month_name} {year} - MCES Education"
-            
-            created_quarters.append({
-                'id': quarter_id,
-                'name': quarter_name,
-                'meeting_date': meeting_date,
-                'slots_created': slots_created,
-                'quarter_number': quarter_num
-            })
+        # Create lecture slots for every new quarter in one statement
+        cursor.execute(_SQL_SEED_LECTURE_SLOTS, (year,))
+        
+        cursor.execute(_SQL_COUNT_TIME_SLOTS)
+        slots_per_quarter = cursor.fetchone()[0]
+        
+        cursor.execute(_SQL_YEAR_QUARTERS, (year,))
+        created_quarters = [{
+            'id': quarter['id'],
+            'name': format_quarter_name(year, quarter['quarter_number']),
+            'meeting_date': quarter['meeting_date'],
+            'slots_created': slots_per_quarter,
+            'quarter_number': quarter['quarter_number']
+        } for quarter in cursor]
         
         conn.commit()
-        conn.close()
+        clear_quarters_cache()
         
-        print(f"🎓 ADMIN ACTION: Created academic year {year} with {len(created_quarters)} quarters")
+        logger.info("🎓 ADMIN ACTION: Created academic year %s with %d quarters", year, len(created_quarters))
         
         return jsonify({
             'message': f'🎉 SUCCESS! Academic year {year} created successfully!',
@@ -388,6 +800,14 @@ def create_academic_year():
             'quarters': created_quarters
         }), 201
         
+    except DatabaseBusy:
+        raise
+    except sqlite3.IntegrityError:
+        # The unique (year, quarter_number) index caught a quarter that already exists
+        return jsonify({
+            'message': f'Academic year {year} already has one of these quarters',
+            'error_type': 'ConflictError'
+        }), 409
     except Exception as e:
         return jsonify({
             'message': f'Error creating academic year: {str(e)}',
@@ -398,11 +818,15 @@ def create_academic_year():
 def delete_academic_year(year):
     """Delete an entire academic year and all its data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db(write=True)
         cursor = conn.cursor()
         
+        # Counts and deletes run in one write transaction so the reported
+        # totals match what was removed
+        cursor.execute('BEGIN IMMEDIATE')
+        
         # Count existing quarters for this year
-        cursor.execute('SELECT COUNT(*) FROM quarters WHERE year = ?', (year,))
+        cursor.execute(_SQL_COUNT_YEAR_QUARTERS, (year,))
         quarter_count = cursor.fetchone()[0]
         
         if quarter_count == 0:
@@ -412,41 +836,19 @@ def delete_academic_year(year):
             }), 404
         
         # Count registrations that will be deleted
-        cursor.execute('''
-            SELECT COUNT(*) FROM speaker_registrations 
-            WHERE lecture_slot_id IN (
-                SELECT id FROM lecture_slots 
-                WHERE quarter_id IN (
-                    SELECT id FROM quarters WHERE year = ?
-                )
-            )
-        ''', (year,))
+        cursor.execute(_SQL_COUNT_YEAR_REGISTRATIONS, (year,))
         registration_count = cursor.fetchone()[0]
         
         # Delete all data for this year (cascade delete)
-        cursor.execute('''
-            DELETE FROM speaker_registrations 
-            WHERE lecture_slot_id IN (
-                SELECT id FROM lecture_slots 
-                WHERE quarter_id IN (
-                    SELECT id FROM quarters WHERE year = ?
-                )
-            )
-        ''', (year,))
-        
-        cursor.execute('''
-            DELETE FROM lecture_slots 
-            WHERE quarter_id IN (
-                SELECT id FROM quarters WHERE year = ?
-            )
-        ''', (year,))
-        
-        cursor.execute('DELETE FROM quarters WHERE year = ?', (year,))
+        cursor.execute(_SQL_DELETE_YEAR_REGISTRATIONS, (year,))
+        cursor.execute(_SQL_DELETE_YEAR_LECTURE_SLOTS, (year,))
+        cursor.execute(_SQL_DELETE_YEAR_QUARTERS, (year,))
         
         conn.commit()
-        conn.close()
+        clear_quarters_cache()
         
-        print(f"🗑️ ADMIN ACTION: Deleted academic year {year} ({quarter_count} quarters, {registration_count} registrations)")
+        logger.info("🗑️ ADMIN ACTION: Deleted academic year %s (%d quarters, %d registrations)",
+                    year, quarter_count, registration_count)
         
         return jsonify({
             'message': f'🎉 SUCCESS! Academic year {year} deleted successfully!',
@@ -454,6 +856,8 @@ def delete_academic_year(year):
             'deleted_registrations': registration_count
         }), 200
         
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'message': f'Error deleting academic year: {str(e)}',
@@ -464,38 +868,25 @@ def delete_academic_year(year):
 def get_academic_years():
     """Get all academic years with summary data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT 
-                q.year,
-                COUNT(q.id) as quarter_count,
-                COUNT(sr.id) as registration_count,
-                MIN(q.meeting_date) as first_meeting,
-                MAX(q.meeting_date) as last_meeting
-            FROM quarters q
-            LEFT JOIN lecture_slots ls ON q.id = ls.quarter_id
-            LEFT JOIN speaker_registrations sr ON ls.id = sr.lecture_slot_id
-            GROUP BY q.year
-            ORDER BY q.year DESC
-        ''')
-        
-        years = cursor.fetchall()
+        cursor.execute(_SQL_ACADEMIC_YEARS)
         
         year_list = []
-        for year_data in years:
+        for year_data in cursor:
             year_list.append({
-                'year': year_data[0],
-                'quarter_count': year_data[1],
-                'registration_count': year_data[2],
-                'first_meeting': year_data[3],
-                'last_meeting': year_data[4]
+                'year': year_data['year'],
+                'quarter_count': year_data['quarter_count'],
+                'registration_count': year_data['registration_count'],
+                'first_meeting': year_data['first_meeting'],
+                'last_meeting': year_data['last_meeting']
             })
         
-        conn.close()
         return jsonify(year_list), 200
         
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'message': f'Error getting academic years: {str(e)}',
@@ -506,96 +897,92 @@ def get_academic_years():
 def get_quarter_slots(quarter_id):
     """Get available slots for a specific quarter with registration info"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT 
-                ls.id, 
-                ls.is_available, 
-                ts.start_time, 
-                ts.end_time, 
-                ts.slot_name,
-                sr.speaker_name,
-                sr.topic_title
-            FROM lecture_slots ls
-            JOIN time_slots ts ON ls.time_slot_id = ts.id
-            LEFT JOIN speaker_registrations sr ON ls.id = sr.lecture_slot_id
-            WHERE ls.quarter_id = ?
-            ORDER BY ts.start_time
-        ''', (quarter_id,))
-        
-        slots = cursor.fetchall()
+        cursor.execute(_SQL_QUARTER_SLOTS, (quarter_id,))
         
         slot_list = []
-        for slot in slots:
-            # Clean time formatting
-            start_time = slot[2]
-            end_time = slot[3]
-            if ':' in start_time:
-                start_time = ':'.join(start_time.split(':')[:2])
-            if ':' in end_time:
-                end_time = ':'.join(end_time.split(':')[:2])
-            
+        for slot in cursor:
             slot_info = {
-                'lecture_slot_id': slot[0],
-                'is_available': bool(slot[1]),
-                'start_time': start_time,
-                'end_time': end_time,
-                'slot_name': slot[4],
-                'time_display': f"{start_time} - {end_time}"
+                'lecture_slot_id': slot['id'],
+                'is_available': bool(slot['is_available']),
+                'start_time': slot['start_time'],
+                'end_time': slot['end_time'],
+                'slot_name': slot['slot_name'],
+                'time_display': slot['time_display']
             }
             
             # Add speaker info if slot is taken
-            if not slot[1] and slot[5]:  # not available and has speaker
-                slot_info['speaker_name'] = slot[5]
-                slot_info['topic_title'] = slot[6]
+            if not slot['is_available'] and slot['speaker_name']:
+                slot_info['speaker_name'] = slot['speaker_name']
+                slot_info['topic_title'] = slot['topic_title']
                 slot_info['status'] = 'booked'
             
             slot_list.append(slot_info)
         
-        conn.close()
         return jsonify(slot_list), 200
         
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'message': f'Error getting slots: {str(e)}',
             'error_type': type(e).__name__
         }), 500
 
+# Registration notifications are delivered by a small background pool
+_notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='notify')
+
+def send_notification_email(data, quarter_info, start_time, end_time):
+    """Announce a new speaker registration"""
+    try:
+        # The logging level only gates this log line (logger.info formats
+        # nothing when INFO is off); the notification is always handed off
+        logger.info(
+            "📧 NEW SPEAKER REGISTRATION: speaker=%s email=%s phone=%s specialty=%s "
+            "meeting=%s date=%s slot=%s - %s topic=%s description=%s",
+            data.get('speaker_name'),
+            data.get('speaker_email'),
+            data.get('speaker_phone', 'Not provided'),
+            data.get('specialty', 'Not provided'),
+            quarter_info['name'],
+            quarter_info['meeting_date'],
+            start_time,
+            end_time,
+            data.get('topic_title'),
+            data.get('topic_description', 'Not provided')
+        )
+    except Exception:
+        # Nobody waits on the future, so make failures visible here
+        logger.exception("❌ Failed to send registration notification")
+
 @app.route('/api/registrations', methods=['POST'])
 def create_registration():
     """Handle speaker registration with notification"""
     try:
-        data = request.get_json()
-        print(f"Registration attempt: {data}")
+        data = request.get_json(silent=True)
+        logger.debug("Registration attempt: %s", data)
         
         if not data:
             return jsonify({'message': 'No data provided'}), 400
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db(write=True)
         cursor = conn.cursor()
         
-        # Check if the slot is still available
-        cursor.execute('''
-            SELECT ls.is_available, q.year, q.quarter_number, q.meeting_date, ts.start_time, ts.end_time
-            FROM lecture_slots ls
-            JOIN quarters q ON ls.quarter_id = q.id
-            JOIN time_slots ts ON ls.time_slot_id = ts.id
-            WHERE ls.id = ?
-        ''', (data.get('lecture_slot_id'),))
-        
+        # Claim the slot and record the registration in a single write transaction.
+        # The guarded UPDATE only succeeds while the slot is still open, so two
+        # concurrent requests can never both book it.
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute(_SQL_CLAIM_SLOT, (data.get('lecture_slot_id'),))
         slot_info = cursor.fetchone()
-        if not slot_info or not slot_info[0]:
-            conn.close()
+        
+        if slot_info is None:
+            conn.rollback()
             return jsonify({'message': 'Selected time slot is no longer available'}), 400
         
         # Create the registration
-        cursor.execute('''
-            INSERT INTO speaker_registrations 
-            (lecture_slot_id, speaker_name, speaker_email, speaker_phone, specialty, topic_title, topic_description, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        cursor.execute(_SQL_INSERT_REGISTRATION, (
             data.get('lecture_slot_id'),
             data.get('speaker_name'),
             data.get('speaker_email'),
@@ -606,58 +993,30 @@ def create_registration():
             'confirmed'
         ))
         
-        # Mark the slot as unavailable
-        cursor.execute('''
-            UPDATE lecture_slots SET is_available = 0 WHERE id = ?
-        ''', (data.get('lecture_slot_id'),))
-        
         conn.commit()
-        conn.close()
+        clear_quarters_cache()
         
         # Send notification
-        quarter_months = {1: 'February', 2: 'May', 3: 'August', 4: 'November'}
-        month_name = quarter_months.get(slot_info[2], f'Q{slot_info[2]}')
-        
         quarter_info = {
-            'name': f"{month_name} {slot_info[1]} - MCES Education",
-            'meeting_date': slot_info[3]
+            'name': format_quarter_name(slot_info['year'], slot_info['quarter_number']),
+            'meeting_date': slot_info['meeting_date']
         }
         
-        # Clean time formatting
-        start_time = slot_info[4]
-        end_time = slot_info[5]
-        if ':' in start_time:
-            start_time = ':'.join(start_time.split(':')[:2])
-        if ':' in end_time:
-            end_time = ':'.join(end_time.split(':')[:2])
-        
-        print(f"""
-        📧 NEW SPEAKER REGISTRATION:
-        ===========================
-        Speaker: {data.get('speaker_name')}
-        Email: {data.get('speaker_email')}
-        Phone: {data.get('speaker_phone', 'Not provided')}
-        Specialty: {data.get('specialty', 'Not provided')}
-        
-        Meeting: {quarter_info['name']}
-        Date: {quarter_info['meeting_date']}
-        Time Slot: {start_time} - {end_time}
-        
-        Topic: {data.get('topic_title')}
-        Description: {data.get('topic_description', 'Not provided')}
-        
-        Registered at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        ===========================
-        """)
-        
-        print(f"Registration successful for {data.get('speaker_name')}")
+        start_time = slot_info['start_time']
+        end_time = slot_info['end_time']
+        
+        # Notify off the request thread so the response doesn't wait on delivery
+        _notify_pool.submit(send_notification_email, data, quarter_info, start_time, end_time)
+        
         return jsonify({
             'message': 'Registration successful!',
             'status': 'confirmed'
         }), 201
         
+    except DatabaseBusy:
+        raise
     except Exception as e:
-        print(f"Registration error: {e}")
+        logger.exception("❌ Registration error")
         return jsonify({
             'message': f'Error creating registration: {str(e)}',
             'error_type': type(e).__name__
@@ -665,19 +1024,64 @@ def create_registration():
 
 # ADMIN ENDPOINTS
 
+# Checked against when the username is unknown, so a miss costs the same hash
+# work as a wrong password and response times don't reveal valid usernames
+_DUMMY_PASSWORD_HASH = hash_password('unused-placeholder-password')
+
+_SQL_UPDATE_ADMIN_PASSWORD = 'UPDATE admin_users SET password_hash = ? WHERE id = ?'
+
+def verify_admin_password(password_hash, password):
+    """Check a password against the stored hash, including legacy plaintext rows"""
+    # Werkzeug hashes look like "method$salt$hash"
+    if '$' in password_hash:
+        return check_password_hash(password_hash, password)
+    
+    # Databases seeded before hashing stored the password as-is
+    return hmac.compare_digest(password_hash.encode(), password.encode())
+
+def password_needs_rehash(password_hash):
+    """Whether a verified hash should be replaced with the current method"""
+    if '$' not in password_hash:
+        return True
+    # Re-hash rows stored with another method or work factor (e.g. pbkdf2 rows
+    # seeded by older releases), which would also make their logins take a
+    # different time from a miss
+    return password_hash.split('$', 1)[0] != _PASSWORD_HASH_METHOD
+
 @app.route('/api/admin/login', methods=['POST'])
 def admin_login():
     """Simple admin login"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         username = data.get('username')
         password = data.get('password')
         
-        if username == 'admin' and password == 'admin123':
+        admin = None
+        if username and password:
+            # Hashing takes a fifth of a second, so hand the read connection
+            # back before checking the password rather than pinning it meanwhile
+            conn = _read_pool.acquire()
+            try:
+                admin = conn.execute(_SQL_ADMIN_BY_USERNAME, (username,)).fetchone()
+            finally:
+                _read_pool.release(conn)
+            
+            if admin is None:
+                check_password_hash(_DUMMY_PASSWORD_HASH, password)
+            elif not verify_admin_password(admin['password_hash'], password):
+                admin = None
+            elif password_needs_rehash(admin['password_hash']):
+                # Hash first so the single writer is held only for the UPDATE
+                new_hash = hash_password(password)
+                conn = get_db(write=True)
+                conn.execute(_SQL_UPDATE_ADMIN_PASSWORD, (new_hash, admin['id']))
+                conn.commit()
+        
+        if admin:
             return jsonify({
                 'success': True,
                 'message': 'Login successful',
-                'user': {'username': 'admin'}
+                'user': {'username': admin['username']}
             }), 200
         else:
             return jsonify({
@@ -685,6 +1089,8 @@ def admin_login():
                 'message': 'Invalid credentials'
             }), 401
             
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'success': False,
@@ -695,74 +1101,62 @@ def admin_login():
 def get_all_registrations():
     """Get all speaker registrations for admin view"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                sr.id,
-                sr.speaker_name,
-                sr.speaker_email,
-                sr.speaker_phone,
-                sr.specialty,
-                sr.topic_title,
-                sr.topic_description,
-                sr.registered_at,
-                sr.status,
-                q.year,
-                q.quarter_number,
-                q.meeting_date,
-                ts.start_time,
-                ts.end_time,
-                ts.slot_name
-            FROM speaker_registrations sr
-            JOIN lecture_slots ls ON sr.lecture_slot_id = ls.id
-            JOIN quarters q ON ls.quarter_id = q.id
-            JOIN time_slots ts ON ls.time_slot_id = ts.id
-            ORDER BY q.year DESC, q.quarter_number ASC, ts.start_time ASC
-        ''')
+        # Without ?limit the full listing is returned as before; with it the
+        # response is one keyset page plus the cursor for the next one
+        limit = request.args.get('limit', type=int)
+        after_id = request.args.get('after_id', 0, type=int)
         
-        registrations = cursor.fetchall()
-        
-        # Map quarter numbers to months
-        quarter_months = {1: 'February', 2: 'May', 3: 'August', 4: 'November'}
-        
-        registration_list = []
-        for reg in registrations:
-            month_name = quarter_months.get(reg[10], f'Q{reg[10]}')
-            quarter_name = f"{month_name} {reg[9]} - MCES Education"
-            
-            # Clean time formatting
-            start_time = reg[12]
-            end_time = reg[13]
-            if ':' in start_time:
-                start_time = ':'.join(start_time.split(':')[:2])
-            if ':' in end_time:
-                end_time = ':'.join(end_time.split(':')[:2])
-            
-            registration_list.append({
-                'id': reg[0],
-                'speaker_name': reg[1],
-                'speaker_email': reg[2],
-                'speaker_phone': reg[3],
-                'specialty': reg[4],
-                'topic_title': reg[5],
-                'topic_description': reg[6],
-                'registered_at': reg[7],
-                'status': reg[8],
-                'quarter_name': quarter_name,
-                'meeting_date': reg[11],
-                'time_slot': f"{start_time} - {end_time}",
-                'slot_name': reg[14]
-            })
-        
-        conn.close()
+        if limit is not None and not 1 <= limit <= _REGISTRATIONS_PAGE_MAX:
+            return jsonify({
+                'message': f'limit must be between 1 and {_REGISTRATIONS_PAGE_MAX}',
+                'error_type': 'ValidationError'
+            }), 400
         
-        return jsonify({
-            'registrations': registration_list,
-            'count': len(registration_list)
-        }), 200
+        conn = get_db()
+        cursor = conn.cursor()
         
+        if limit is None:
+            cursor.execute(_SQL_ALL_REGISTRATIONS)
+        else:
+            cursor.execute(_SQL_REGISTRATIONS_PAGE, (after_id, limit))
+        
+        def generate():
+            # Same {"registrations": [...], "count": n} body as before, written
+            # row by row straight off the cursor (and sent uncompressed, see
+            # compress_response)
+            count = 0
+            last_id = None
+            yield b'{"registrations":['
+            for reg in cursor:
+                if count:
+                    yield b','
+                yield orjson.dumps({
+                    'id': reg['id'],
+                    'speaker_name': reg['speaker_name'],
+                    'speaker_email': reg['speaker_email'],
+                    'speaker_phone': reg['speaker_phone'],
+                    'specialty': reg['specialty'],
+                    'topic_title': reg['topic_title'],
+                    'topic_description': reg['topic_description'],
+                    'registered_at': reg['registered_at'],
+                    'status': reg['status'],
+                    'quarter_name': format_quarter_name(reg['year'], reg['quarter_number']),
+                    'meeting_date': reg['meeting_date'],
+                    'time_slot': reg['time_display'],
+                    'slot_name': reg['slot_name']
+                })
+                count += 1
+                last_id = reg['id']
+            if limit is None:
+                yield b'],"count":%d}' % count
+            else:
+                next_cursor = last_id if count == limit else None
+                yield b'],"count":%d,"next_cursor":%s}' % (count, orjson.dumps(next_cursor))
+        
+        return app.response_class(stream_with_context(generate()), mimetype='application/json'), 200
+        
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'message': f'Error getting registrations: {str(e)}',
@@ -773,9 +1167,13 @@ def get_all_registrations():
 def reset_registrations():
     """Reset all speaker registrations"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db(write=True)
         cursor = conn.cursor()
         
+        # Counts and deletes run in one write transaction so the reported
+        # totals match what was removed
+        cursor.execute('BEGIN IMMEDIATE')
+        
         # Count existing registrations
         cursor.execute('SELECT COUNT(*) FROM speaker_registrations')
         registration_count = cursor.fetchone()[0]
@@ -787,9 +1185,9 @@ def reset_registrations():
         cursor.execute('UPDATE lecture_slots SET is_available = 1')
         
         conn.commit()
-        conn.close()
+        clear_quarters_cache()
         
-        print(f"🔄 ADMIN ACTION: Reset {registration_count} registrations")
+        logger.info("🔄 ADMIN ACTION: Reset %d registrations", registration_count)
         
         return jsonify({
             'message': f'🎉 SUCCESS! System reset complete!',
@@ -797,6 +1195,8 @@ def reset_registrations():
             'status': 'All time slots are now available'
         }), 200
         
+    except DatabaseBusy:
+        raise
     except Exception as e:
         return jsonify({
             'message': f'Error resetting registrations: {str(e)}',
@@ -811,6 +1211,16 @@ def api_test():
         "status": "success"
     }, 200
 
+# The SPA build ships with the app, so check for its entry page once at startup
+_INDEX_EXISTS = os.path.exists(os.path.join(app.static_folder, 'index.html'))
+
+@app.after_request
+def cache_hashed_assets(response):
+    """Mark content-hashed build assets as immutable so browsers never revalidate them"""
+    if request.path.startswith('/assets/') and response.status_code in (200, 304):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
@@ -818,14 +1228,22 @@ def serve(path):
     if static_folder_path is None:
         return "Static folder not configured", 404
 
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
-        return send_from_directory(static_folder_path, path)
+    if path != "":
+        # send_from_directory already resolves the path safely and answers
+        # conditional requests, so let it decide whether the file exists
+        try:
+            return send_from_directory(static_folder_path, path)
+        except NotFound:
+            # A missing hashed asset must not get the SPA shell, which
+            # cache_hashed_assets would then mark immutable under a JS/CSS URL
+            if path.startswith('assets/'):
+                raise
+
+    if _INDEX_EXISTS:
+        # Always revalidate the SPA shell so a new deploy picks up new asset hashes
+        return send_from_directory(static_folder_path, 'index.html', max_age=0)
     else:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
-            return send_from_directory(static_folder_path, 'index.html')
-        else:
-            return "MCES Quarterly Education Series Scheduler - Server Running", 200
+        return "MCES Quarterly Education Series Scheduler - Server Running", 200
 
 @app.route('/health')
 def health_check():
@@ -833,5 +1251,5 @@ def health_check():
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    print(f"🚀 Starting MCES Quarterly Education Series Scheduler on port {port}")
+    logger.info("🚀 Starting MCES Quarterly Education Series Scheduler on port %s", port)
     app.run(host='0.0.0.0', port=port, debug=False)
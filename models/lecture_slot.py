@@ -21,15 +21,30 @@ class LectureSlot(db.Model):
         return f'<LectureSlot Q{self.quarter.quarter_number if self.quarter else "?"} {self.time_slot.slot_name if self.time_slot else "?"}>'
     
     def to_dict(self):
+        return LectureSlot.build_dict(
+            self.id,
+            self.quarter_id,
+            self.time_slot_id,
+            self.is_available,
+            self.created_at,
+            self.quarter.to_dict() if self.quarter else None,
+            self.time_slot.to_dict() if self.time_slot else None,
+            len(self.registrations)
+        )
+    
+    @staticmethod
+    def build_dict(lecture_slot_id, quarter_id, time_slot_id, is_available, created_at,
+                   quarter, time_slot, registration_count):
+        """Serialise lecture slot columns around already-serialised quarter and time slot dicts"""
         return {
-            'id': self.id,
-            'quarter_id': self.quarter_id,
-            'time_slot_id': self.time_slot_id,
-            'is_available': self.is_available,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'quarter': self.quarter.to_dict() if self.quarter else None,
-            'time_slot': self.time_slot.to_dict() if self.time_slot else None,
-            'registration_count': len(self.registrations)
+            'id': lecture_slot_id,
+            'quarter_id': quarter_id,
+            'time_slot_id': time_slot_id,
+            'is_available': is_available,
+            'created_at': created_at.isoformat() if created_at else None,
+            'quarter': quarter,
+            'time_slot': time_slot,
+            'registration_count': registration_count
         }
     
     def mark_unavailable(self):
@@ -6,6 +6,9 @@ class Quarter(db.Model):
     __tablename__ = 'quarters'
     
     id = db.Column(db.Integer, primary_key=True)
+    # (year, quarter_number) is unique and the active listing is indexed; both
+    # indexes come from main.py's startup DDL, which also reaches tables
+    # create_all made
     year = db.Column(db.Integer, nullable=False)
     quarter_number = db.Column(db.Integer, nullable=False)  # 1-4
     meeting_date = db.Column(db.Date, nullable=False)
@@ -16,6 +16,14 @@ class SpeakerRegistration(db.Model):
     registered_at = db.Column(db.DateTime, default=datetime.utcnow)
     status = db.Column(db.String(50), default='confirmed')  # 'confirmed', 'pending', 'cancelled'
     
+    # Only the ORM routes query these columns: email/status backs the
+    # one-registration-per-quarter check, registered_at the newest-first
+    # listings. The lecture_slot_id indexes come from main.py's startup DDL.
+    __table_args__ = (
+        db.Index('ix_speaker_registrations_email_status', 'speaker_email', 'status'),
+        db.Index('ix_speaker_registrations_registered_at', 'registered_at'),
+    )
+    
     def __repr__(self):
         return f'<SpeakerRegistration {self.speaker_name} - {self.topic_title}>'
     
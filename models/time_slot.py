@@ -17,11 +17,16 @@ class TimeSlot(db.Model):
         return f'<TimeSlot {self.slot_name}>'
     
     def to_dict(self):
+        return TimeSlot.build_dict(self.id, self.start_time, self.end_time, self.slot_name)
+    
+    @staticmethod
+    def build_dict(time_slot_id, start_time, end_time, slot_name):
+        """Serialise time slot columns; shared by to_dict and column-only queries"""
         return {
-            'id': self.id,
-            'start_time': self.start_time.strftime('%H:%M') if self.start_time else None,
-            'end_time': self.end_time.strftime('%H:%M') if self.end_time else None,
-            'slot_name': self.slot_name
+            'id': time_slot_id,
+            'start_time': start_time.strftime('%H:%M') if start_time else None,
+            'end_time': end_time.strftime('%H:%M') if end_time else None,
+            'slot_name': slot_name
         }
     
     @staticmethod
@@ -33,11 +38,12 @@ class TimeSlot(db.Model):
             {'start_time': time(11, 0), 'end_time': time(12, 0), 'slot_name': 'Late Morning Session (11:00-12:00)'}
         ]
         
-        for slot_data in slots:
-            existing = TimeSlot.query.filter_by(start_time=slot_data['start_time']).first()
-            if not existing:
-                slot = TimeSlot(**slot_data)
-                db.session.add(slot)
+        # Look up every existing start time at once rather than one query per slot
+        existing = {start_time for (start_time,) in db.session.query(TimeSlot.start_time)}
         
+        db.session.add_all([
+            TimeSlot(**slot_data) for slot_data in slots
+            if slot_data['start_time'] not in existing
+        ])
         db.session.commit()
 
@@ -1,7 +1,41 @@
+import sqlite3
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import raiseload
 
 db = SQLAlchemy()
 
+# WAL so readers never wait on a writer, then the same per-connection tuning
+# main.py gives its pooled connections. pysqlite already waits 5 seconds on a
+# locked database.
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA mmap_size=268435456'
+)
+
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every SQLite connection as the engine opens it"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+def lazy_load_guard():
+    """Loader options that make list queries fail on unplanned lazy loads under TESTING"""
+    # Only loads that would hit the database raise; relationships already in
+    # the identity map still resolve
+    if current_app.testing:
+        return (raiseload('*', sql_only=True),)
+    return ()
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -1,4 +1,9 @@
-from flask import Blueprint, request, jsonify, session
+import csv
+import io
+import time
+from flask import Blueprint, Response, request, jsonify, session, stream_with_context
+from sqlalchemy import case, func
+from sqlalchemy.orm import contains_eager
 from src.models.user import db
 from src.models.admin_user import AdminUser
 from src.models.quarter import Quarter
@@ -17,6 +22,26 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# check-auth is polled by the admin UI; profiles rarely change, so serve them
+# from a short per-process cache instead of querying on every poll
+ADMIN_CACHE_TTL = 60
+_admin_cache = {}
+
+def get_admin_profile(admin_id):
+    """Return the admin's to_dict(), or None if the account no longer exists"""
+    cached = _admin_cache.get(admin_id)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    
+    admin = db.session.get(AdminUser, admin_id)
+    if not admin:
+        _admin_cache.pop(admin_id, None)
+        return None
+    
+    profile = admin.to_dict()
+    _admin_cache[admin_id] = (profile, time.monotonic() + ADMIN_CACHE_TTL)
+    return profile
+
 @admin_bp.route('/admin/login', methods=['POST'])
 def admin_login():
     """Admin login endpoint"""
@@ -52,12 +77,12 @@ def admin_logout():
 def check_admin_auth():
     """Check if admin is authenticated"""
     if 'admin_id' in session:
-        admin = AdminUser.query.get(session['admin_id'])
+        admin = get_admin_profile(session['admin_id'])
         if admin:
             return jsonify({
                 'success': True,
                 'authenticated': True,
-                'admin': admin.to_dict()
+                'admin': admin
             })
     
     return jsonify({
@@ -70,9 +95,11 @@ def check_admin_auth():
 def admin_dashboard():
     """Get admin dashboard data"""
     try:
-        # Get summary statistics
-        total_quarters = Quarter.query.count()
-        active_quarters = Quarter.query.filter_by(is_active=True).count()
+        # Get summary statistics; both quarter totals come from one scan
+        total_quarters, active_quarters = db.session.query(
+            func.count(Quarter.id),
+            func.coalesce(func.sum(case((Quarter.is_active == True, 1), else_=0)), 0)
+        ).one()
         total_registrations = SpeakerRegistration.query.filter_by(status='confirmed').count()
         
         # Get recent registrations
@@ -80,18 +107,22 @@ def admin_dashboard():
             SpeakerRegistration.registered_at.desc()
         ).limit(10).all()
         
+        # Confirmed registrations per quarter, counted in one grouped query
+        registration_counts = dict(
+            db.session.query(LectureSlot.quarter_id, func.count(SpeakerRegistration.id))
+            .join(SpeakerRegistration)
+            .filter(SpeakerRegistration.status == 'confirmed')
+            .group_by(LectureSlot.quarter_id)
+            .all()
+        )
+        
         # Get quarters with registration counts
         quarters_with_counts = []
         quarters = Quarter.query.order_by(Quarter.year.desc(), Quarter.quarter_number.desc()).all()
         
         for quarter in quarters:
-            registration_count = SpeakerRegistration.query.join(LectureSlot).filter(
-                LectureSlot.quarter_id == quarter.id,
-                SpeakerRegistration.status == 'confirmed'
-            ).count()
-            
             quarter_data = quarter.to_dict()
-            quarter_data['registration_count'] = registration_count
+            quarter_data['registration_count'] = registration_counts.get(quarter.id, 0)
             quarter_data['total_slots'] = 3  # Always 3 time slots per quarter
             quarters_with_counts.append(quarter_data)
         
@@ -111,39 +142,77 @@ def admin_dashboard():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+EXPORT_COLUMNS = (
+    'Quarter', 'Meeting Date', 'Time Slot', 'Speaker Name', 'Email', 'Phone',
+    'Specialty', 'Topic Title', 'Topic Description', 'Registration Date', 'Status'
+)
+
+def export_row_values(reg):
+    """Flatten a registration into values matching EXPORT_COLUMNS"""
+    return (
+        f"{reg.lecture_slot.quarter.year} Q{reg.lecture_slot.quarter.quarter_number}",
+        reg.lecture_slot.quarter.meeting_date.isoformat(),
+        reg.lecture_slot.time_slot.slot_name,
+        reg.speaker_name,
+        reg.speaker_email,
+        reg.speaker_phone or '',
+        reg.specialty or '',
+        reg.topic_title or '',
+        reg.topic_description or '',
+        reg.registered_at.isoformat(),
+        reg.status
+    )
+
+def generate_export_csv(registrations):
+    """Yield the export as CSV one line at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    writer.writerow(EXPORT_COLUMNS)
+    for reg in registrations:
+        writer.writerow(export_row_values(reg))
+        
+        # Hand back whatever csv.writer produced and reuse the buffer
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    
+    # Flush the header when there were no rows to carry it
+    yield buffer.getvalue()
+
 @admin_bp.route('/admin/export/registrations', methods=['GET'])
 @admin_required
 def export_registrations():
-    """Export registrations data"""
+    """Export registrations data as JSON, or as a streamed CSV file with ?format=csv"""
     try:
         quarter_id = request.args.get('quarter_id', type=int)
         
-        query = SpeakerRegistration.query.join(LectureSlot)
+        # Every export row reads the slot's quarter and time slot, so load them
+        # in the same SELECT instead of lazily per row
+        query = SpeakerRegistration.query.join(LectureSlot).options(
+            contains_eager(SpeakerRegistration.lecture_slot).joinedload(LectureSlot.quarter),
+            contains_eager(SpeakerRegistration.lecture_slot).joinedload(LectureSlot.time_slot)
+        )
         
         if quarter_id:
             query = query.filter(LectureSlot.quarter_id == quarter_id)
         
-        registrations = query.order_by(
+        query = query.order_by(
             LectureSlot.quarter_id.desc(),
             SpeakerRegistration.registered_at.desc()
-        ).all()
+        )
+        
+        if request.args.get('format') == 'csv':
+            # Fetch rows in batches while streaming instead of loading them all up front
+            filename = f"registrations_{quarter_id or 'all'}.csv"
+            return Response(
+                stream_with_context(generate_export_csv(query.yield_per(500))),
+                mimetype='text/csv',
+                headers={'Content-Disposition': f'attachment; filename={filename}'}
+            )
         
         # Format data for export
-        export_data = []
-        for reg in registrations:
-            export_data.append({
-                'Quarter': f"{reg.lecture_slot.quarter.year} Q{reg.lecture_slot.quarter.quarter_number}",
-                'Meeting Date': reg.lecture_slot.quarter.meeting_date.isoformat(),
-                'Time Slot': reg.lecture_slot.time_slot.slot_name,
-                'Speaker Name': reg.speaker_name,
-                'Email': reg.speaker_email,
-                'Phone': reg.speaker_phone or '',
-                'Specialty': reg.specialty or '',
-                'Topic Title': reg.topic_title or '',
-                'Topic Description': reg.topic_description or '',
-                'Registration Date': reg.registered_at.isoformat(),
-                'Status': reg.status
-            })
+        export_data = [dict(zip(EXPORT_COLUMNS, export_row_values(reg))) for reg in query]
         
         return jsonify({
             'success': True,
@@ -163,7 +232,7 @@ def change_admin_password():
         if not data or 'current_password' not in data or 'new_password' not in data:
             return jsonify({'success': False, 'error': 'Current and new password required'}), 400
         
-        admin = AdminUser.query.get(session['admin_id'])
+        admin = db.session.get(AdminUser, session['admin_id'])
         
         if not admin.check_password(data['current_password']):
             return jsonify({'success': False, 'error': 'Current password is incorrect'}), 400
@@ -173,6 +242,7 @@ def change_admin_password():
         
         admin.set_password(data['new_password'])
         db.session.commit()
+        _admin_cache.pop(admin.id, None)
         
         return jsonify({
             'success': True,
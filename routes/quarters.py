@@ -1,20 +1,41 @@
+import time
 from flask import Blueprint, request, jsonify
-from src.models.user import db
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from src.models.user import db, lazy_load_guard
 from src.models.quarter import Quarter
 from src.models.time_slot import TimeSlot
 from src.models.lecture_slot import LectureSlot
-from datetime import datetime
+from src.models.speaker_registration import SpeakerRegistration
+from datetime import date
 
 quarters_bp = Blueprint('quarters', __name__)
 
+# The public active-quarters listing only changes through the quarter routes
+# below, which clear it; the TTL bounds staleness from writes made by other
+# processes
+ACTIVE_QUARTERS_CACHE_TTL = 60
+_active_quarters_cache = {}
+
+def clear_active_quarters_cache():
+    """Drop the cached active-quarters listing after a quarter changes"""
+    _active_quarters_cache.clear()
+
 @quarters_bp.route('/quarters/active', methods=['GET'])
 def get_active_quarters():
     """Get all active quarters"""
     try:
-        quarters = Quarter.query.filter_by(is_active=True).order_by(Quarter.year.desc(), Quarter.quarter_number.desc()).all()
+        cached = _active_quarters_cache.get('quarters')
+        if cached and cached[1] > time.monotonic():
+            quarter_list = cached[0]
+        else:
+            quarters = Quarter.query.filter_by(is_active=True).options(*lazy_load_guard()).order_by(Quarter.year.desc(), Quarter.quarter_number.desc()).all()
+            quarter_list = [quarter.to_dict() for quarter in quarters]
+            _active_quarters_cache['quarters'] = (quarter_list, time.monotonic() + ACTIVE_QUARTERS_CACHE_TTL)
+        
         return jsonify({
             'success': True,
-            'quarters': [quarter.to_dict() for quarter in quarters]
+            'quarters': quarter_list
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -23,36 +44,60 @@ def get_active_quarters():
 def get_available_slots(quarter_id):
     """Get available lecture slots for a specific quarter"""
     try:
-        quarter = Quarter.query.get_or_404(quarter_id)
-        
-        # Get all time slots
-        time_slots = TimeSlot.query.all()
-        available_slots = []
-        
-        for time_slot in time_slots:
-            # Check if there's a lecture slot for this quarter-time combination
-            lecture_slot = LectureSlot.query.filter_by(
-                quarter_id=quarter_id,
-                time_slot_id=time_slot.id
-            ).first()
-            
-            if not lecture_slot:
-                # Create lecture slot if it doesn't exist
-                lecture_slot = LectureSlot(
-                    quarter_id=quarter_id,
-                    time_slot_id=time_slot.id,
-                    is_available=True
-                )
-                db.session.add(lecture_slot)
-                db.session.commit()
-            
-            if lecture_slot.is_available:
-                slot_data = lecture_slot.to_dict()
-                available_slots.append(slot_data)
+        quarter = db.get_or_404(Quarter, quarter_id)
+        
+        # Create any missing quarter-time combinations in a single commit
+        existing_time_slot_ids = {
+            time_slot_id for (time_slot_id,) in
+            db.session.query(LectureSlot.time_slot_id).filter_by(quarter_id=quarter_id)
+        }
+        missing_slots = [
+            LectureSlot(quarter_id=quarter_id, time_slot_id=time_slot_id, is_available=True)
+            for (time_slot_id,) in db.session.query(TimeSlot.id)
+            if time_slot_id not in existing_time_slot_ids
+        ]
+        if missing_slots:
+            db.session.add_all(missing_slots)
+            db.session.commit()
+        
+        # Select just the columns LectureSlot.to_dict() would serialise and feed
+        # them through the same build_dict helpers, without loading ORM objects
+        registration_count = select(func.count(SpeakerRegistration.id)).where(
+            SpeakerRegistration.lecture_slot_id == LectureSlot.id
+        ).scalar_subquery()
+        
+        rows = db.session.query(
+            LectureSlot.id,
+            LectureSlot.time_slot_id,
+            LectureSlot.is_available,
+            LectureSlot.created_at,
+            TimeSlot.start_time,
+            TimeSlot.end_time,
+            TimeSlot.slot_name,
+            registration_count.label('registration_count')
+        ).join(TimeSlot).filter(
+            LectureSlot.quarter_id == quarter_id,
+            LectureSlot.is_available == True
+        ).order_by(TimeSlot.id)
+        
+        quarter_data = quarter.to_dict()
+        available_slots = [
+            LectureSlot.build_dict(
+                row.id,
+                quarter_id,
+                row.time_slot_id,
+                row.is_available,
+                row.created_at,
+                quarter_data,
+                TimeSlot.build_dict(row.time_slot_id, row.start_time, row.end_time, row.slot_name),
+                row.registration_count
+            )
+            for row in rows
+        ]
         
         return jsonify({
             'success': True,
-            'quarter': quarter.to_dict(),
+            'quarter': quarter_data,
             'available_slots': available_slots
         })
     except Exception as e:
@@ -84,47 +129,51 @@ def create_quarter():
         
         # Parse meeting date
         try:
-            meeting_date = datetime.strptime(data['meeting_date'], '%Y-%m-%d').date()
+            meeting_date = date.fromisoformat(data['meeting_date'])
         except ValueError:
             return jsonify({'success': False, 'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
         
         # Check if quarter already exists
-        existing = Quarter.query.filter_by(
-            year=data['year'],
-            quarter_number=data['quarter_number']
-        ).first()
+        existing = db.session.query(
+            select(Quarter.id).filter_by(year=data['year'], quarter_number=data['quarter_number']).exists()
+        ).scalar()
         
         if existing:
-            return jsonify({'success': False, 'error': 'Quarter already exists'}), 400
+            return jsonify({'success': False, 'error': 'Quarter already exists'}), 409
         
-        # Create new quarter
+        # Create new quarter; flushing assigns its id without committing
         quarter = Quarter(
             year=data['year'],
             quarter_number=data['quarter_number'],
             meeting_date=meeting_date,
             is_active=data.get('is_active', True)
         )
-        
         db.session.add(quarter)
-        db.session.commit()
-        
-        # Create lecture slots for this quarter
-        time_slots = TimeSlot.query.all()
-        for time_slot in time_slots:
-            lecture_slot = LectureSlot(
-                quarter_id=quarter.id,
-                time_slot_id=time_slot.id,
-                is_available=True
-            )
-            db.session.add(lecture_slot)
+        db.session.flush()
+        
+        # Create lecture slots for this quarter in one executemany; the rows
+        # aren't used afterwards, so skip building ORM objects for them. The
+        # quarter and its slots are committed together.
+        lecture_slot_rows = [
+            {'quarter_id': quarter.id, 'time_slot_id': time_slot_id, 'is_available': True}
+            for (time_slot_id,) in db.session.query(TimeSlot.id)
+        ]
+        if lecture_slot_rows:
+            db.session.execute(LectureSlot.__table__.insert(), lecture_slot_rows)
         
         db.session.commit()
+        clear_active_quarters_cache()
         
         return jsonify({
             'success': True,
             'quarter': quarter.to_dict()
         }), 201
         
+    except IntegrityError:
+        # Another request created the same quarter between the check and the
+        # commit, where the database has the unique (year, quarter_number) index
+        db.session.rollback()
+        return jsonify({'success': False, 'error': 'Quarter already exists'}), 409
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -133,7 +182,7 @@ def create_quarter():
 def update_quarter(quarter_id):
     """Update a quarter (admin only)"""
     try:
-        quarter = Quarter.query.get_or_404(quarter_id)
+        quarter = db.get_or_404(Quarter, quarter_id)
         data = request.get_json()
         
         # Update fields if provided
@@ -142,17 +191,22 @@ def update_quarter(quarter_id):
         if 'quarter_number' in data:
             quarter.quarter_number = data['quarter_number']
         if 'meeting_date' in data:
-            quarter.meeting_date = datetime.strptime(data['meeting_date'], '%Y-%m-%d').date()
+            quarter.meeting_date = date.fromisoformat(data['meeting_date'])
         if 'is_active' in data:
             quarter.is_active = data['is_active']
         
         db.session.commit()
+        clear_active_quarters_cache()
         
         return jsonify({
             'success': True,
             'quarter': quarter.to_dict()
         })
         
+    except IntegrityError:
+        # Moving a quarter onto an existing year/quarter_number trips the unique constraint
+        db.session.rollback()
+        return jsonify({'success': False, 'error': 'Quarter already exists'}), 409
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -161,9 +215,10 @@ def update_quarter(quarter_id):
 def delete_quarter(quarter_id):
     """Delete a quarter (admin only)"""
     try:
-        quarter = Quarter.query.get_or_404(quarter_id)
+        quarter = db.get_or_404(Quarter, quarter_id)
         db.session.delete(quarter)
         db.session.commit()
+        clear_active_quarters_cache()
         
         return jsonify({
             'success': True,
@@ -1,5 +1,8 @@
-from flask import Blueprint, request, jsonify
-from src.models.user import db
+from flask import Blueprint, abort, request, jsonify
+from sqlalchemy import insert, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
+from src.models.user import db, lazy_load_guard
 from src.models.lecture_slot import LectureSlot
 from src.models.speaker_registration import SpeakerRegistration
 from datetime import datetime
@@ -7,10 +10,11 @@ import re
 
 registrations_bp = Blueprint('registrations', __name__)
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def validate_email(email):
     """Simple email validation"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 @registrations_bp.route('/registrations', methods=['POST'])
 def create_registration():
@@ -29,45 +33,66 @@ def create_registration():
             return jsonify({'success': False, 'error': 'Invalid email format'}), 400
         
         # Check if lecture slot exists and is available
-        lecture_slot = LectureSlot.query.get(data['lecture_slot_id'])
+        lecture_slot = db.session.get(LectureSlot, data['lecture_slot_id'])
         if not lecture_slot:
             return jsonify({'success': False, 'error': 'Lecture slot not found'}), 404
         
         if not lecture_slot.is_available:
-            return jsonify({'success': False, 'error': 'This time slot is no longer available'}), 400
+            return jsonify({'success': False, 'error': 'This time slot is no longer available'}), 409
+        
+        # Claim the slot with a conditional UPDATE so two concurrent requests
+        # can't both pass the availability check above and double-book it
+        claimed = LectureSlot.query.filter_by(
+            id=lecture_slot.id,
+            is_available=True
+        ).update({'is_available': False}, synchronize_session=False)
+        
+        if not claimed:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': 'This time slot is no longer available'}), 409
         
-        # Check if speaker already registered for this quarter
-        existing_registration = SpeakerRegistration.query.join(LectureSlot).filter(
+        # Create registration, unless the speaker already holds a confirmed slot
+        # in this quarter; the check runs inside the INSERT itself so two
+        # concurrent submissions can't both get through
+        already_registered = select(SpeakerRegistration.id).join(LectureSlot).where(
             LectureSlot.quarter_id == lecture_slot.quarter_id,
             SpeakerRegistration.speaker_email == data['speaker_email'],
             SpeakerRegistration.status == 'confirmed'
-        ).first()
+        ).exists()
+        
+        registration_values = {
+            'lecture_slot_id': lecture_slot.id,
+            'speaker_name': data['speaker_name'],
+            'speaker_email': data['speaker_email'],
+            'speaker_phone': data.get('speaker_phone', ''),
+            'specialty': data.get('specialty', ''),
+            'topic_title': data.get('topic_title', ''),
+            'topic_description': data.get('topic_description', ''),
+            'registered_at': datetime.utcnow(),
+            'status': 'confirmed'
+        }
+        columns = SpeakerRegistration.__table__.c
+        new_registration = select(*(
+            literal(value, columns[name].type) for name, value in registration_values.items()
+        )).where(~already_registered)
+        
+        registration_id = db.session.execute(
+            insert(SpeakerRegistration)
+            .from_select(list(registration_values), new_registration)
+            .returning(SpeakerRegistration.id)
+        ).scalar()
         
-        if existing_registration:
+        if registration_id is None:
+            db.session.rollback()
             return jsonify({
                 'success': False, 
                 'error': 'You have already registered for a slot in this quarter'
-            }), 400
-        
-        # Create registration
-        registration = SpeakerRegistration(
-            lecture_slot_id=data['lecture_slot_id'],
-            speaker_name=data['speaker_name'],
-            speaker_email=data['speaker_email'],
-            speaker_phone=data.get('speaker_phone', ''),
-            specialty=data.get('specialty', ''),
-            topic_title=data.get('topic_title', ''),
-            topic_description=data.get('topic_description', ''),
-            status='confirmed'
-        )
-        
-        db.session.add(registration)
-        
-        # Mark lecture slot as unavailable
-        lecture_slot.is_available = False
+            }), 409
         
         db.session.commit()
         
+        registration = db.session.get(SpeakerRegistration, registration_id)
+        
         return jsonify({
             'success': True,
             'registration': registration.to_dict(),
@@ -82,7 +107,7 @@ def create_registration():
 def get_registration(registration_id):
     """Get registration details"""
     try:
-        registration = SpeakerRegistration.query.get_or_404(registration_id)
+        registration = db.get_or_404(SpeakerRegistration, registration_id)
         return jsonify({
             'success': True,
             'registration': registration.to_dict()
@@ -100,8 +125,21 @@ def get_all_registrations():
         
         query = SpeakerRegistration.query
         
+        # to_dict() walks each registration's slot, quarter, time slot and the
+        # slot's registrations; load them per relationship, not per row. The
+        # quarter filter's join already carries the slot columns.
         if quarter_id:
-            query = query.join(LectureSlot).filter(LectureSlot.quarter_id == quarter_id)
+            query = query.join(SpeakerRegistration.lecture_slot).filter(LectureSlot.quarter_id == quarter_id)
+            slot_loader = contains_eager(SpeakerRegistration.lecture_slot)
+        else:
+            slot_loader = selectinload(SpeakerRegistration.lecture_slot)
+        
+        query = query.options(
+            slot_loader.selectinload(LectureSlot.quarter),
+            slot_loader.selectinload(LectureSlot.time_slot),
+            slot_loader.selectinload(LectureSlot.registrations),
+            *lazy_load_guard()
+        )
         
         if status:
             query = query.filter(SpeakerRegistration.status == status)
@@ -119,7 +157,14 @@ def get_all_registrations():
 def update_registration(registration_id):
     """Update registration status (admin only)"""
     try:
-        registration = SpeakerRegistration.query.get_or_404(registration_id)
+        # Status changes flip the slot's availability, so fetch it in the same query
+        registration = db.session.get(
+            SpeakerRegistration,
+            registration_id,
+            options=[joinedload(SpeakerRegistration.lecture_slot)]
+        )
+        if registration is None:
+            abort(404)
         data = request.get_json()
         
         old_status = registration.status
@@ -156,6 +201,11 @@ def update_registration(registration_id):
             'registration': registration.to_dict()
         })
         
+    except IntegrityError:
+        # Re-confirming a registration whose slot has since been booked trips
+        # the one-confirmed-speaker-per-slot index
+        db.session.rollback()
+        return jsonify({'success': False, 'error': 'This time slot is no longer available'}), 409
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -164,7 +214,13 @@ def update_registration(registration_id):
 def delete_registration(registration_id):
     """Delete registration (admin only)"""
     try:
-        registration = SpeakerRegistration.query.get_or_404(registration_id)
+        registration = db.session.get(
+            SpeakerRegistration,
+            registration_id,
+            options=[joinedload(SpeakerRegistration.lecture_slot)]
+        )
+        if registration is None:
+            abort(404)
         
         # Make the lecture slot available again
         if registration.lecture_slot:
@@ -184,15 +240,32 @@ def delete_registration(registration_id):
 
 @registrations_bp.route('/registrations/check-availability', methods=['POST'])
 def check_slot_availability():
-    """Check if a specific slot is still available"""
+    """Check if a specific slot, or a list of slots, is still available"""
     try:
         data = request.get_json()
+        
+        # A calendar view can ask about all of its slots in one request
+        lecture_slot_ids = data.get('lecture_slot_ids')
+        if lecture_slot_ids is not None:
+            if not isinstance(lecture_slot_ids, list):
+                return jsonify({'success': False, 'error': 'lecture_slot_ids must be a list'}), 400
+            
+            rows = LectureSlot.query.with_entities(
+                LectureSlot.id,
+                LectureSlot.is_available
+            ).filter(LectureSlot.id.in_(lecture_slot_ids)).all()
+            
+            return jsonify({
+                'success': True,
+                'availability': {slot_id: is_available for slot_id, is_available in rows}
+            })
+        
         lecture_slot_id = data.get('lecture_slot_id')
         
         if not lecture_slot_id:
             return jsonify({'success': False, 'error': 'Missing lecture_slot_id'}), 400
         
-        lecture_slot = LectureSlot.query.get(lecture_slot_id)
+        lecture_slot = db.session.get(LectureSlot, lecture_slot_id)
         if not lecture_slot:
             return jsonify({'success': False, 'error': 'Lecture slot not found'}), 404
         
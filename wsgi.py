@@ -0,0 +1,2 @@
+# Entry point for gunicorn: gunicorn wsgi:app
+from main import app